@@ -2,17 +2,25 @@
 
 Evaluates:
 1. Classification accuracy (does sentiment match expected?)
-2. Explanation quality (quick LLM check - is explanation grounded in text?)
+2. Explanation quality (is explanation grounded in text? self-reported by the
+   same call, not an independent judge)
+
+Both come from one fused prompt: SentimentSignature plus an is_grounded output.
 """
 
+import argparse
 import os
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
 import dspy
 
 from classifier_demo import SentimentAnalyzer
+from classifier_demo.analyzer import SentimentSignature
+from classifier_demo.config import NUM_THREADS
 from classifier_demo.optimization import load_dataset
 
 warnings.filterwarnings("ignore")
@@ -20,17 +28,26 @@ warnings.filterwarnings("ignore")
 OPTIMIZED_MODEL_PATH = Path(__file__).parent / "optimized_sentiment.json"
 
 
-class ExplanationCheckSignature(dspy.Signature):
-    """Check if an explanation is grounded in the original text."""
-
-    original_text: str = dspy.InputField(desc="The original text being analyzed")
-    explanation: str = dspy.InputField(desc="The explanation given for the sentiment")
-    is_grounded: bool = dspy.OutputField(
-        desc="True if explanation only references content from original text, False if it invents things"
-    )
+# The production signature plus a self-reported grounding flag, so instructions
+# and field descriptions stay identical to what SentimentAnalyzer sends
+SentimentWithGroundingSignature = SentimentSignature.append(
+    "is_grounded",
+    dspy.OutputField(
+        desc="True if explanation only references content from the text, False if it invents things"
+    ),
+    type_=bool,
+)
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all LLM calls as one Message Batches job (half the cost, slower turnaround)",
+    )
+    args = parser.parse_args()
+
     load_dotenv()
 
     if not os.getenv("ANTHROPIC_API_KEY"):
@@ -41,10 +58,9 @@ def main():
     optimized_path = OPTIMIZED_MODEL_PATH if OPTIMIZED_MODEL_PATH.exists() else None
     analyzer = SentimentAnalyzer(optimized_path=optimized_path)
 
-    # Create explanation checker with Haiku for fast grounding checks
-    haiku_lm = dspy.LM("anthropic/claude-haiku-4-5-20251001")
-    explanation_checker = dspy.Predict(ExplanationCheckSignature)
-    explanation_checker.lm = haiku_lm  # Use Haiku instead of default
+    # Classify and check grounding in one call, reusing the analyzer's few-shot demos
+    predict = dspy.Predict(SentimentWithGroundingSignature)
+    predict.demos = analyzer.predict.demos
 
     # Load test data
     data_path = Path(__file__).parent / "data" / "sentiment_dataset.json"
@@ -58,31 +74,43 @@ def main():
     print(f"Evaluating {sample_size} samples...")
     if optimized_path:
         print("(Using optimized model)")
+    if args.batch:
+        print("(Using Message Batches API - this may take a few minutes)")
     print()
 
+    texts = [item["text"] for item in sample_data]
+    if args.batch:
+        results = analyzer.predict_checked(texts, predict, batch=True)
+    else:
+        with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+            results = list(
+                executor.map(
+                    lambda text: analyzer.predict_checked([text], predict)[0], texts
+                )
+            )
+
     correct_sentiment = 0
     grounded_explanations = 0
+    lines = []
 
-    for i, item in enumerate(sample_data):
-        result = analyzer.analyze(item["text"])
-
+    for i, (item, result) in enumerate(zip(sample_data, results)):
         # Check sentiment accuracy
-        sentiment_correct = result["sentiment"] == item["sentiment"]
+        sentiment_correct = result.sentiment == item["sentiment"]
         if sentiment_correct:
             correct_sentiment += 1
 
-        # Check if explanation is grounded (using Haiku - fast)
-        check = explanation_checker(
-            original_text=item["text"],
-            explanation=result["explanation"],
-        )
-        if check.is_grounded:
+        if result.is_grounded:
             grounded_explanations += 1
 
-        # Print progress
         status = "✓" if sentiment_correct else "✗"
-        grounded = "grounded" if check.is_grounded else "NOT grounded"
-        print(f"  [{i + 1}/{sample_size}] {status} {result['sentiment']} ({grounded})")
+        grounded = "grounded" if result.is_grounded else "NOT grounded"
+        lines.append(
+            f"  [{i + 1}/{sample_size}] {status} {result.sentiment} ({grounded})"
+        )
+
+    # Print per-sample results in one write
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     # Results
     print()
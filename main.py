@@ -2,9 +2,15 @@ import os
 import warnings
 from pathlib import Path
 from dotenv import load_dotenv
+from guardrails.errors import ValidationError
 import mlflow
 from classifier_demo import SentimentAnalyzer
 
+try:
+    import readline  # noqa: F401 - line editing and history for input()
+except ImportError:
+    pass
+
 OPTIMIZED_MODEL_PATH = Path(__file__).parent / "optimized_sentiment.json"
 
 # Suppress DSPy/LiteLLM serialization warnings
@@ -25,24 +31,38 @@ def main():
     print("Sentiment Analyzer")
     print("-" * 40)
 
-    text = input("Enter text to analyze: ")
-
-    if not text.strip():
-        print("No text provided.")
-        return
-
-    print("\nAnalyzing...")
-
     # Use optimized model if available
     optimized_path = OPTIMIZED_MODEL_PATH if OPTIMIZED_MODEL_PATH.exists() else None
     if optimized_path:
         print("(Using optimized model)")
 
+    # Build the analyzer once and reuse it for every prompt
     analyzer = SentimentAnalyzer(optimized_path=optimized_path)
-    result = analyzer.analyze(text)
 
-    print(f"\nSentiment: {result['sentiment']}")
-    print(f"Explanation: {result['explanation']}")
+    print("Enter text to analyze (empty line, 'quit' or Ctrl-D to exit).")
+
+    while True:
+        try:
+            text = input("\n> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not text or text in {"quit", "exit"}:
+            break
+
+        print("Analyzing...")
+        try:
+            result = analyzer.analyze(text)
+        except (ValidationError, ValueError) as e:
+            print(f"Error: {e}")
+            continue
+        except KeyboardInterrupt:
+            print()
+            break
+
+        print(f"\nSentiment: {result['sentiment']}")
+        print(f"Explanation: {result['explanation']}")
 
 
 if __name__ == "__main__":
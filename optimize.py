@@ -1,5 +1,6 @@
 """Script to run DSPy optimization on the sentiment analyzer."""
 
+import argparse
 import os
 import warnings
 from pathlib import Path
@@ -16,12 +17,22 @@ from classifier_demo.optimization import (
 )
 from classifier_demo.analyzer import SentimentSignature
 from classifier_demo.config import DEFAULT_MODEL
+from classifier_demo.lm import configure_lm
 
 # Suppress DSPy/LiteLLM serialization warnings
 warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--candidates",
+        type=int,
+        default=0,
+        help="Search over this many candidate demo sets in parallel (BootstrapFewShotWithRandomSearch)",
+    )
+    args = parser.parse_args()
+
     load_dotenv()
 
     if not os.getenv("ANTHROPIC_API_KEY"):
@@ -38,7 +49,7 @@ def main():
     print("-" * 50)
 
     # Configure DSPy
-    dspy.configure(lm=dspy.LM(DEFAULT_MODEL))
+    configure_lm(DEFAULT_MODEL)
 
     # Baseline evaluation (unoptimized)
     print("\n1. Evaluating baseline (unoptimized)...")
@@ -47,13 +58,22 @@ def main():
     print(f"   Baseline accuracy: {baseline_acc:.1%}")
 
     # Optimize
-    print("\n2. Running BootstrapFewShot optimization...")
+    if args.candidates:
+        print(
+            f"\n2. Running BootstrapFewShotWithRandomSearch ({args.candidates} candidates)..."
+        )
+    else:
+        print("\n2. Running BootstrapFewShot optimization...")
     print("   (This will make several LLM calls to find good few-shot examples)")
-    optimized = optimize(trainset)
+    optimized = optimize(trainset, num_candidate_programs=args.candidates)
 
     # Evaluate optimized
     print("\n3. Evaluating optimized model...")
-    optimized_acc = evaluate(optimized, testset)
+    optimized_acc = evaluate(optimized, testset, min_acc=baseline_acc)
+    if optimized_acc < baseline_acc:
+        print("   Stopped early: optimized model cannot match the baseline")
+        print("   Not saving - keeping any existing optimized model")
+        return
     print(f"   Optimized accuracy: {optimized_acc:.1%}")
 
     # Summary
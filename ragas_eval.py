@@ -10,16 +10,19 @@ This catches cases where the model invents reasons not present in the text.
 import os
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
 from ragas import evaluate
 from ragas.metrics._faithfulness import Faithfulness
 from ragas.llms import LangchainLLMWrapper
+from ragas.run_config import RunConfig
 from langchain_anthropic import ChatAnthropic
 from datasets import Dataset
 
 from classifier_demo import SentimentAnalyzer
+from classifier_demo.config import NUM_THREADS
 from classifier_demo.optimization import load_dataset
 
 warnings.filterwarnings("ignore")
@@ -65,9 +68,12 @@ def main():
         "retrieved_contexts": [],  # The original text (context for the explanation)
     }
 
-    for item in sample_data:
-        result = analyzer.analyze(item["text"])
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(
+            executor.map(lambda item: analyzer.analyze(item["text"]), sample_data)
+        )
 
+    for item, result in zip(sample_data, results):
         results_data["user_input"].append(
             f"What is the sentiment of this text and why? Text: {item['text']}"
         )
@@ -92,6 +98,7 @@ def main():
         dataset=dataset,
         metrics=[Faithfulness()],
         llm=evaluator_llm,
+        run_config=RunConfig(max_workers=NUM_THREADS),
     )
 
     print(f"  RAGAs evaluation took {time.time() - t0:.1f}s")
@@ -117,12 +124,10 @@ def main():
     # Per-sample breakdown
     print("Per-sample breakdown:")
     print("-" * 50)
-    for i, row in df.iterrows():
-        original_text = (
-            sample_data[i]["text"][:50] + "..."
-            if len(sample_data[i]["text"]) > 50
-            else sample_data[i]["text"]
-        )
+    records = df[["response", "faithfulness"]].to_dict("records")
+    for item, row in zip(sample_data, records):
+        text = item["text"]
+        original_text = text[:50] + "..." if len(text) > 50 else text
         print(f'\n  Text: "{original_text}"')
         print(f"  Response: {row['response'][:80]}...")
         print(f"  Faithfulness: {row['faithfulness']:.0%}")
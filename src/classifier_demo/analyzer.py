@@ -1,13 +1,20 @@
 """Sentiment analysis using Claude via DSPy with Guardrails validation."""
 
+import copy
 from pathlib import Path
 from typing import TypedDict
 
 import dspy
 from guardrails import Guard
 
+from .batch import batch_predict
 from .config import COMPETITORS, DEFAULT_MODEL, Sentiment, VALID_SENTIMENTS
-from .validators import NoCompetitors, NoPII, NoProfanity, ValidChoices
+from .lm import configure_lm
+from .validators import InputValidator
+
+# Optimized predictor states, keyed by resolved path and mtime, so repeated
+# SentimentAnalyzer construction skips re-reading and re-validating the file
+_PREDICTOR_STATE_CACHE: dict[tuple[Path, int], dict] = {}
 
 
 class SentimentResult(TypedDict):
@@ -34,37 +41,67 @@ class SentimentAnalyzer(dspy.Module):
         optimized_path: Path | str | None = None,
     ):
         super().__init__()
-        dspy.configure(lm=dspy.LM(model))
+        configure_lm(model)
         self.predict = dspy.Predict(SentimentSignature)
 
-        # Guardrail: Validate input (chained validators)
-        self.input_guard = (
-            Guard()
-            .use(NoProfanity(on_fail="exception"))
-            .use(NoPII(on_fail="exception"))
-            .use(NoCompetitors(competitors=COMPETITORS, on_fail="exception"))
-        )
-
-        # Guardrail: Validate sentiment output is one of the allowed values
-        self.output_guard = Guard().use(
-            ValidChoices(choices=VALID_SENTIMENTS, on_fail="exception")
+        # Guardrail: Validate input (profanity, PII and competitors in one step)
+        self.input_guard = Guard().use(
+            InputValidator(competitors=COMPETITORS, on_fail="exception")
         )
 
         if optimized_path is not None:
-            self.predict.load(Path(optimized_path))
+            path = Path(optimized_path).resolve()
+            key = (path, path.stat().st_mtime_ns)
+            if key in _PREDICTOR_STATE_CACHE:
+                self.predict.load_state(copy.deepcopy(_PREDICTOR_STATE_CACHE[key]))
+            else:
+                self.predict.load(path)
+                _PREDICTOR_STATE_CACHE[key] = copy.deepcopy(self.predict.dump_state())
 
     def forward(self, text: str) -> dspy.Prediction:
         return self.predict(text=text)
 
-    def analyze(self, text: str) -> SentimentResult:
-        """Analyze sentiment and return structured result."""
+    def validate_output(self, sentiment: str) -> None:
+        """Check the sentiment is one of the allowed values.
+
+        The Sentiment Literal already constrains the LLM output, so this is a
+        plain set lookup rather than a full Guardrails pass.
+        """
+        if sentiment not in VALID_SENTIMENTS:
+            raise ValueError(
+                f"Sentiment '{sentiment}' is not one of {sorted(VALID_SENTIMENTS)}"
+            )
+
+    def predict_checked(
+        self,
+        texts: list[str],
+        predict: dspy.Predict | None = None,
+        batch: bool = False,
+    ) -> list[dspy.Prediction]:
+        """Validate inputs, run a predictor over them and validate each sentiment.
+
+        Uses this analyzer unless another predictor is given (any signature with
+        a text input and a sentiment output). With batch=True, all texts go
+        through a single Message Batches job.
+        """
         # Validate input before sending to LLM
-        self.input_guard.validate(text)
+        for text in texts:
+            self.input_guard.validate(text)
+
+        if batch:
+            results = batch_predict(
+                predict or self.predict, [{"text": text} for text in texts]
+            )
+        else:
+            results = [(predict or self)(text=text) for text in texts]
 
-        result = self(text=text)
+        for result in results:
+            self.validate_output(result.sentiment)
+        return results
 
-        # Validate output with guardrail
-        self.output_guard.validate(result.sentiment)
+    def analyze(self, text: str) -> SentimentResult:
+        """Analyze sentiment and return structured result."""
+        (result,) = self.predict_checked([text])
 
         return SentimentResult(
             sentiment=result.sentiment,
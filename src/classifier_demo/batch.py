@@ -0,0 +1,110 @@
+"""Run DSPy predictors through the Anthropic Message Batches API."""
+
+import json
+import time
+from typing import Any
+
+import anthropic
+import dspy
+import pydantic
+
+# Tool the model is forced to call under JSONAdapter, mirroring what LiteLLM
+# does for response_format on direct calls
+OUTPUT_TOOL_NAME = "json_tool_call"
+
+
+def _output_tool(signature: type[dspy.Signature]) -> dict[str, Any]:
+    """Build an Anthropic tool whose input schema is the signature's outputs."""
+    model = pydantic.create_model(
+        signature.__name__,
+        **{
+            name: (field.annotation, ...)
+            for name, field in signature.output_fields.items()
+        },
+    )
+    return {"name": OUTPUT_TOOL_NAME, "input_schema": model.model_json_schema()}
+
+
+def batch_predict(
+    predict: dspy.Predict,
+    inputs: list[dict[str, Any]],
+    poll_interval: float = 10.0,
+) -> list[dspy.Prediction]:
+    """Run a predictor over many inputs as a single Message Batches job.
+
+    Prompts are rendered and parsed with the active DSPy adapter, so each
+    prediction matches what calling ``predict`` directly would return, at
+    half the token cost and without one round-trip per input. Completions
+    are cached like any other DSPy LM call.
+    """
+    lm = predict.lm or dspy.settings.lm
+    adapter = dspy.settings.adapter or dspy.ChatAdapter()
+
+    params: dict[str, Any] = {
+        "model": lm.model.removeprefix("anthropic/"),
+        "max_tokens": lm.kwargs.get("max_tokens") or 4000,
+    }
+    if lm.kwargs.get("temperature") is not None:
+        params["temperature"] = lm.kwargs["temperature"]
+    structured = isinstance(adapter, dspy.JSONAdapter)
+    if structured:
+        params["tools"] = [_output_tool(predict.signature)]
+        params["tool_choice"] = {"type": "tool", "name": OUTPUT_TOOL_NAME}
+
+    pending: dict[str, dict[str, Any]] = {}
+    completions: list[str | None] = [None] * len(inputs)
+    for i, kwargs in enumerate(inputs):
+        messages = adapter.format(predict.signature, predict.demos, kwargs)
+        request = {
+            **params,
+            "system": "\n\n".join(
+                m["content"] for m in messages if m["role"] == "system"
+            ),
+            "messages": [m for m in messages if m["role"] != "system"],
+        }
+        # Same on-disk cache DSPy uses for direct LM calls, keyed by the full
+        # rendered prompt, so reruns only submit prompts not seen before
+        if lm.cache:
+            completions[i] = dspy.cache.get({"message_batches": request})
+        if completions[i] is None:
+            pending[str(i)] = request
+
+    if pending:
+        client = anthropic.Anthropic()
+        batch = client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": request}
+                for custom_id, request in pending.items()
+            ]
+        )
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                raise RuntimeError(
+                    f"Batch request {entry.custom_id} did not succeed: {entry.result.type}"
+                )
+            i = int(entry.custom_id)
+            content = entry.result.message.content
+            if structured:
+                completions[i] = next(
+                    json.dumps(block.input)
+                    for block in content
+                    if block.type == "tool_use"
+                )
+            else:
+                completions[i] = "".join(
+                    block.text for block in content if block.type == "text"
+                )
+            if lm.cache:
+                dspy.cache.put(
+                    {"message_batches": pending[entry.custom_id]},
+                    completions[i],
+                )
+
+    return [
+        dspy.Prediction(**adapter.parse(predict.signature, completion))
+        for completion in completions
+    ]
@@ -4,8 +4,18 @@ from typing import Literal, get_args
 
 DEFAULT_MODEL = "anthropic/claude-sonnet-4-20250514"
 
+# Anthropic prompt caching breakpoint: the message just before the user's input
+# (the last few-shot demo, or the system prompt when there are none). Anthropic
+# only caches a prefix of at least 1,024 tokens on Sonnet, and the default
+# instructions + 4 short demos stay well below that, so this has no effect
+# until the prefix grows (e.g. more or longer demos)
+PROMPT_CACHE_POINTS = [{"location": "message", "index": -2}]
+
+# Concurrent LLM calls during evaluation - size to your Anthropic rate-limit tier
+NUM_THREADS = 16
+
 Sentiment = Literal["POSITIVE", "NEGATIVE", "NEUTRAL"]
-VALID_SENTIMENTS = list(get_args(Sentiment))
+VALID_SENTIMENTS: frozenset[str] = frozenset(get_args(Sentiment))
 
 # Example competitor list - customize for your use case
 COMPETITORS = ["openai", "chatgpt", "gemini", "grok", "llama", "mistral"]
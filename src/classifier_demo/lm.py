@@ -0,0 +1,32 @@
+"""Shared DSPy language model instances and adapter."""
+
+import dspy
+
+from .config import PROMPT_CACHE_POINTS
+
+_LM_CACHE: dict[str, dspy.LM] = {}
+
+# Structured outputs: LiteLLM sends the signature's JSON schema to Anthropic as
+# a forced tool call, so outputs such as the Sentiment Literal are constrained
+# during generation (an enum) rather than parsed out of free text
+_ADAPTER = dspy.JSONAdapter()
+
+
+def get_lm(model: str) -> dspy.LM:
+    """Return the process-wide LM for a model, creating it on first use."""
+    if model not in _LM_CACHE:
+        _LM_CACHE[model] = dspy.LM(
+            model, cache_control_injection_points=PROMPT_CACHE_POINTS
+        )
+    return _LM_CACHE[model]
+
+
+def configure_lm(model: str) -> dspy.LM:
+    """Make a model DSPy's default LM with the structured-output adapter.
+
+    Skips the update if both are already configured.
+    """
+    lm = get_lm(model)
+    if dspy.settings.lm is not lm or dspy.settings.adapter is not _ADAPTER:
+        dspy.configure(lm=lm, adapter=_ADAPTER)
+    return lm
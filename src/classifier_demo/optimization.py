@@ -1,11 +1,14 @@
-import json
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TypedDict
 
 import dspy
+import orjson
 
 from .analyzer import SentimentSignature
-from .config import DEFAULT_MODEL, Sentiment
+from .config import DEFAULT_MODEL, NUM_THREADS, Sentiment
+from .lm import configure_lm
 
 
 class Example(TypedDict):
@@ -15,8 +18,7 @@ class Example(TypedDict):
 
 def load_dataset(path: Path) -> list[Example]:
     """Load sentiment dataset from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
 
 
 def sentiment_metric(
@@ -30,10 +32,12 @@ def split_dataset(
     data: list[Example], train_ratio: float = 0.7
 ) -> tuple[list[dspy.Example], list[dspy.Example]]:
     """Split dataset into train and test sets as DSPy Examples."""
-    examples = [
-        dspy.Example(text=item["text"], sentiment=item["sentiment"]).with_inputs("text")
-        for item in data
-    ]
+    examples = []
+    for item in data:
+        example = dspy.Example(text=item["text"], sentiment=item["sentiment"])
+        # Same as .with_inputs("text"), minus the Example copy it makes per item
+        example._input_keys = {"text"}
+        examples.append(example)
     split_idx = int(len(examples) * train_ratio)
     return examples[:split_idx], examples[split_idx:]
 
@@ -43,29 +47,69 @@ def optimize(
     model: str = DEFAULT_MODEL,
     max_bootstrapped_demos: int = 4,
     max_labeled_demos: int = 4,
+    num_candidate_programs: int = 0,
+    num_threads: int = NUM_THREADS,
 ) -> dspy.Module:
-    """Optimize the SentimentAnalyzer using BootstrapFewShot."""
-    dspy.configure(lm=dspy.LM(model))
+    """Optimize the SentimentAnalyzer using BootstrapFewShot.
+
+    With num_candidate_programs > 0, uses BootstrapFewShotWithRandomSearch
+    instead: that many candidate demo sets are bootstrapped and scored on the
+    trainset in parallel, and the best one is kept.
+    """
+    configure_lm(model)
 
     # Create a simple predictor for optimization
     predictor = dspy.Predict(SentimentSignature)
 
-    # Use BootstrapFewShot optimizer
-    optimizer = dspy.BootstrapFewShot(
-        metric=sentiment_metric,
-        max_bootstrapped_demos=max_bootstrapped_demos,
-        max_labeled_demos=max_labeled_demos,
-    )
+    if num_candidate_programs > 0:
+        optimizer = dspy.BootstrapFewShotWithRandomSearch(
+            metric=sentiment_metric,
+            max_bootstrapped_demos=max_bootstrapped_demos,
+            max_labeled_demos=max_labeled_demos,
+            num_candidate_programs=num_candidate_programs,
+            num_threads=num_threads,
+        )
+    else:
+        # Use BootstrapFewShot optimizer
+        optimizer = dspy.BootstrapFewShot(
+            metric=sentiment_metric,
+            max_bootstrapped_demos=max_bootstrapped_demos,
+            max_labeled_demos=max_labeled_demos,
+        )
 
     optimized = optimizer.compile(predictor, trainset=trainset)
     return optimized
 
 
-def evaluate(module: dspy.Module, testset: list[dspy.Example]) -> float:
-    """Evaluate module accuracy on test set."""
-    correct = 0
-    for example in testset:
-        prediction = module(text=example.text)
-        if prediction.sentiment == example.sentiment:
-            correct += 1
+def evaluate(
+    module: dspy.Module,
+    testset: list[dspy.Example],
+    num_threads: int = NUM_THREADS,
+    *,
+    min_acc: float | None = None,
+) -> float:
+    """Evaluate module accuracy on test set, running predictions concurrently.
+
+    If min_acc is given, stops as soon as it is out of reach and returns the
+    accuracy over the examples scored so far (which is then below min_acc).
+    """
+    correct = seen = 0
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        # Run each call in a copy of this context so dspy.context() overrides
+        # (LM, callbacks, usage tracker) reach the worker threads
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run, module, text=example.text
+            ): example
+            for example in testset
+        }
+        for future in as_completed(futures):
+            seen += 1
+            if future.result().sentiment == futures[future].sentiment:
+                correct += 1
+
+            remaining = len(testset) - seen
+            if min_acc is not None and (correct + remaining) / len(testset) < min_acc:
+                executor.shutdown(cancel_futures=True)
+                return correct / seen
     return correct / len(testset)
@@ -1,6 +1,7 @@
 """Custom Guardrails validators for input/output validation."""
 
 import re
+from collections.abc import Iterable
 from typing import Any
 
 from better_profanity import profanity
@@ -17,15 +18,15 @@ from guardrails.validators import (
 class ValidChoices(Validator):
     """Validates that a value is one of the allowed choices."""
 
-    def __init__(self, choices: list[str], on_fail: str = "exception"):
+    def __init__(self, choices: Iterable[str], on_fail: str = "exception"):
         super().__init__(on_fail=on_fail)
-        self.choices = choices
+        self.choices = frozenset(choices)
 
     def validate(self, value: Any, metadata: dict = {}) -> ValidationResult:
         if value in self.choices:
             return PassResult()
         return FailResult(
-            error_message=f"Value '{value}' is not in allowed choices: {self.choices}"
+            error_message=f"Value '{value}' is not in allowed choices: {sorted(self.choices)}"
         )
 
 
@@ -53,9 +54,11 @@ class NoPII(Validator):
     """Detects PII (emails, phone numbers, SSNs) in text."""
 
     PII_PATTERNS = {
-        "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-        "phone": r"\b(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}\b",
-        "ssn": r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b",
+        "email": re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+        "phone": re.compile(
+            r"\b(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}\b"
+        ),
+        "ssn": re.compile(r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b"),
     }
 
     def __init__(self, detect: list[str] | None = None, on_fail: str = "exception"):
@@ -66,7 +69,7 @@ class NoPII(Validator):
         found_pii = []
         for pii_type in self.detect:
             pattern = self.PII_PATTERNS.get(pii_type)
-            if pattern and re.search(pattern, value):
+            if pattern and pattern.search(value):
                 found_pii.append(pii_type)
 
         if not found_pii:
@@ -83,12 +86,48 @@ class NoCompetitors(Validator):
     def __init__(self, competitors: list[str], on_fail: str = "exception"):
         super().__init__(on_fail=on_fail)
         self.competitors = [c.lower() for c in competitors]
+        # Single case-insensitive alternation instead of one substring scan per
+        # name; "(?!)" never matches, so an empty list blocks nothing
+        self._pattern = re.compile(
+            "|".join(re.escape(c) for c in self.competitors) or r"(?!)",
+            re.IGNORECASE,
+        )
 
     def validate(self, value: Any, metadata: dict = {}) -> ValidationResult:
-        text_lower = value.lower()
-        found = [c for c in self.competitors if c in text_lower]
-        if not found:
+        if not self._pattern.search(value):
             return PassResult()
         return FailResult(
             error_message="Input mentions competitors. Please focus on our products only."
         )
+
+
+@register_validator(name="input_validator", data_type="string")
+class InputValidator(Validator):
+    """Runs the profanity, PII and competitor checks as a single validator.
+
+    One Guard step instead of three chained ones; reports every failed check.
+    """
+
+    def __init__(
+        self,
+        competitors: list[str],
+        custom_words: list[str] | None = None,
+        detect_pii: list[str] | None = None,
+        on_fail: str = "exception",
+    ):
+        super().__init__(on_fail=on_fail)
+        self.validators = [
+            NoProfanity(custom_words=custom_words, on_fail=on_fail),
+            NoPII(detect=detect_pii, on_fail=on_fail),
+            NoCompetitors(competitors=competitors, on_fail=on_fail),
+        ]
+
+    def validate(self, value: Any, metadata: dict = {}) -> ValidationResult:
+        errors = [
+            result.error_message
+            for validator in self.validators
+            if isinstance(result := validator.validate(value, metadata), FailResult)
+        ]
+        if not errors:
+            return PassResult()
+        return FailResult(error_message=" ".join(errors))